@@ -5,21 +5,57 @@ Orchestrates ingestion from the unstable API.
 
 This script:
 1. Creates the API client + logger
-2. Iterates through pages using the client's built-in retry logic
-3. Streams all results into a CSV (memory-safe)
-4. Uploads the resulting CSV to S3
+2. Fetches pages concurrently (asyncio + aiohttp) using the client's built-in retry logic,
+   on a background thread that prefetches ahead of the writer
+3. Streams all results into a CSV (memory-safe) or, optionally, Parquet
+4. Uploads the resulting file to S3 (or, with `stream_upload`, streams it
+   straight into a multipart upload without touching local disk)
 5. Creates a summary ingestion report
 """
 
+import asyncio
 import csv
+import gzip
+import io
 import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import chain
+from operator import itemgetter
 from src.utils.logger import AppLogger
 from src.utils.auth_client import AuthClient
 from src.utils.unstable_api_client import UnstableAPIClient
 from src.utils.s3_client import S3FileClient
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # only needed for output_format="parquet"
+    pa = pq = None
+
+try:
+    import zstandard
+except ImportError:  # only needed for compression="zstd"
+    zstandard = None
+
+try:
+    import uvloop
+except ImportError:  # falls back to the default asyncio event loop
+    uvloop = None
+
 OUTPUT_DIR = "./data"
+WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB file buffer → far fewer write() syscalls
+WRITE_BATCH_ROWS = 10_000    # rows accumulated before each batched write
+PREFETCH_PAGES = 4           # fetched pages buffered ahead of the writer
+MAX_PART_UPLOADS = 4         # rolling-part uploads allowed in flight at once
+OUTPUT_FORMATS = ("csv", "parquet")
+COMPRESSION_SUFFIXES = {None: "", "gzip": ".gz", "zstd": ".zst"}
+FORMAT_REASONS = {
+    "csv": "CSV (Reason: Streaming efficiency)",
+    "parquet": "PARQUET (Reason: Columnar compression for analytics)",
+}
 
 aws_profile = os.getenv("AWS_PROFILE")
 
@@ -33,16 +69,54 @@ def run_ingestion_pipeline(
     password: str,
     csv_filename: str = None,
     report_filename: str = None,
-) -> tuple[str, str]:
+    concurrency: int = 16,
+    stream_upload: bool = False,
+    output_format: str = "csv",
+    compression: str | None = None,
+    part_size: int | None = None,
+) -> tuple[str | None, str]:
     """
     Run the ingestion pipeline.
 
+    Pages are fetched on a background thread with up to `concurrency`
+    requests in flight (`concurrency=1` fetches sequentially) and written to
+    the output in page order by a single consumer, so writing overlaps with
+    network fetches.
+
+    By default the output is written to ./data and uploaded afterwards (handy
+    for debugging). With `stream_upload=True` the writer feeds a multipart S3
+    upload directly, so parts are PUT while later pages are still being
+    fetched and no local file is written.
+
+    `output_format` is "csv" (default) or "parquet" (zstd-compressed,
+    requires pyarrow). CSV can additionally be compressed in-flight with
+    `compression="gzip"` (level 1) or `"zstd"` (multi-threaded, requires
+    zstandard); the file and S3 key get a `.gz` / `.zst` suffix.
+
+    With `part_size` (bytes, e.g. 64 MiB) the local output rolls over into
+    self-contained part files, and each part is uploaded in the background
+    as soon as it closes, so uploading overlaps with ingestion. Parts land
+    under one S3 prefix (`.../<name>_<timestamp>/part-00001.csv`, ...), a
+    layout Athena/Spark/pyarrow read as a single dataset.
+
     Returns:
-        tuple: (local CSV path, S3 URI)
+        tuple: (local output path — a directory of parts with `part_size`,
+                or None when streaming — and the S3 URI)
     """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output_format {output_format!r}; expected one of {OUTPUT_FORMATS}")
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unsupported compression {compression!r}; expected gzip, zstd or None")
+    if compression and output_format == "parquet":
+        raise ValueError("Parquet output is already compressed (zstd); drop `compression`")
+    if part_size and stream_upload:
+        raise ValueError("`part_size` applies to local output; it can't be combined with `stream_upload`")
+
+    extension = output_format + COMPRESSION_SUFFIXES[compression]
+
+    # One clock read drives every filename/key so they correlate exactly
     start_time = datetime.now()
-
-    pages_requested = 0
+    file_ts = start_time.strftime('%Y%m%d_%H%M%S')
 
     # -------------------------
     # SETUP
@@ -52,12 +126,14 @@ def run_ingestion_pipeline(
 
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-    # Filenames
-    csv_output = os.path.join(
-        OUTPUT_DIR, csv_filename or f"unstable_raw_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+    # Filenames: the extension always follows the chosen format/compression,
+    # so e.g. CSV_FILENAME=customers.csv with Parquet yields customers.parquet
+    base_name = _strip_output_extension(csv_filename) if csv_filename else None
+    output_path = os.path.join(
+        OUTPUT_DIR, f"{base_name}.{extension}" if base_name else f"unstable_raw_{file_ts}.{extension}"
     )
     report_output = os.path.join(
-        OUTPUT_DIR, report_filename or f"report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+        OUTPUT_DIR, report_filename or f"report_{file_ts}.txt"
     )
 
     try:
@@ -80,66 +156,99 @@ def run_ingestion_pipeline(
         )
 
         # -------------------------
-        # CSV INGESTION
-        # -------------------------
-        total_rows = 0
-        with open(csv_output, "w", newline="", encoding="utf-8") as csvfile:
-            writer = None
-
-            for page_num, data in client.iterate_all_pages(limit=1000):
-                pages_requested += 1
-
-                if not data:
-                    logger.warning(f"Page {page_num} returned no data.")
-                    continue
-
-                items = data.get("data") or []
-                if not items:
-                    logger.info(f"Page {page_num} contained 0 records.")
-                    continue
-
-                # --- Discover union of all keys ---
-                fieldnames = set()
-                for r in items:
-                    fieldnames.update(r.keys())
-                fieldnames = sorted(fieldnames)
-
-                if writer is None:
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                    writer.writeheader()
-
-                # --- Safe write using row.get(key, "N/A") ---
-                for row in items:
-                    safe_row = {key: row.get(key, "N/A") for key in fieldnames}
-                    writer.writerow(safe_row)
-                    total_rows += 1
-
-                logger.info(f"Page {page_num} ingested ({len(items)} records, {total_rows} total)")
-
-        # -------------------------
-        # UPLOAD TO S3
+        # S3 DESTINATION
         # -------------------------
-        logger.info("Uploading output to S3...")
-
         uploader = S3FileClient(logger, aws_profile, region_name="us-west-2")
 
         # derive folder from provided key
         s3_folder = os.path.dirname(s3_key)  # e.g., "Bond/raw/"
 
         # new key = folder + timestamped local filename
-        timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
-        timestamped_key = f"{s3_folder}/{csv_filename}_{timestamp}.csv"
-
-        success = uploader.upload_file(
-            local_path=csv_output,
-            bucket=s3_bucket,
-            key=timestamped_key
-        )
+        timestamp = start_time.strftime('%Y-%m-%d_%H-%M-%S')
+        timestamped_key = f"{s3_folder}/{base_name or 'unstable_raw'}_{timestamp}.{extension}"
+        s3_uri = f"s3://{s3_bucket}/{timestamped_key}"
+        extra_args = {"ContentEncoding": "gzip"} if compression == "gzip" else None
+
+        if part_size:
+            # -------------------------
+            # INGESTION → ROLLING LOCAL PARTS (uploaded while ingesting)
+            # -------------------------
+            s3_prefix = timestamped_key[:-len(extension) - 1]
+            s3_uri = f"s3://{s3_bucket}/{s3_prefix}/"
+            output_path = os.path.join(OUTPUT_DIR, f"{base_name or 'unstable_raw'}_{file_ts}_parts")
+            logger.info(f"Writing {output_format.upper()} parts to {output_path}, uploading each to {s3_uri}...")
+
+            sink = _RollingPartSink(
+                output_path,
+                extension,
+                open_part_sink=lambda fileobj: _open_sink(fileobj, output_format, compression),
+                uploader=uploader,
+                bucket=s3_bucket,
+                s3_prefix=s3_prefix,
+                part_size=part_size,
+                extra_args=extra_args
+            )
+            try:
+                pages_requested, total_rows, drift_fields = _ingest(client, sink, concurrency, logger)
+            except BaseException:
+                sink.abort()
+                raise
+
+            success = sink.success
+
+        elif stream_upload:
+            # -------------------------
+            # INGESTION → S3 (single streaming pass)
+            # -------------------------
+            logger.info(f"Streaming {output_format.upper()} directly to {s3_uri}...")
+            output_path = None
+
+            stream = uploader.open_upload_stream(s3_bucket, timestamped_key, extra_args=extra_args)
+            try:
+                pages_requested, total_rows, drift_fields = _ingest(
+                    client, _open_sink(stream, output_format, compression), concurrency, logger
+                )
+            except BaseException:
+                stream.abort()
+                raise
+
+            if total_rows:
+                success = stream.close()
+            else:
+                stream.abort()
+                success = None
 
-        if not success:
+        else:
+            # -------------------------
+            # INGESTION → LOCAL FILE
+            # -------------------------
+            with open(output_path, "wb", buffering=WRITE_BUFFER_SIZE) as outfile:
+                pages_requested, total_rows, drift_fields = _ingest(
+                    client, _open_sink(outfile, output_format, compression), concurrency, logger
+                )
+
+            # -------------------------
+            # UPLOAD TO S3
+            # -------------------------
+            if total_rows:
+                logger.info("Uploading output to S3...")
+
+                success = uploader.upload_file(
+                    local_path=output_path,
+                    bucket=s3_bucket,
+                    key=timestamped_key,
+                    extra_args=extra_args
+                )
+            else:
+                success = None
+
+        # None: no rows were ingested, so nothing was uploaded
+        if success is None:
+            logger.warning("No records were ingested; nothing was uploaded to S3.")
+        elif not success:
             logger.error("S3 upload failed.")
         else:
-            logger.info(f"S3 upload complete: s3://{s3_bucket}/{timestamped_key}")
+            logger.info(f"S3 upload complete: {s3_uri}")
 
         # -------------------------
         # REPORT GENERATION
@@ -153,19 +262,377 @@ def run_ingestion_pipeline(
             total_retries=client.retry_count,
             records_ingested=client.records_ingested,
             execution_time=execution_time,
-            csv_path=csv_output,
+            output_path=output_path or s3_uri,
+            output_format=output_format,
             report_path=report_output,
+            schema_drift=drift_fields,
             logger=logger
         )
 
         logger.info("Ingestion pipeline finished successfully.")
-        return csv_output, f"s3://{s3_bucket}/{timestamped_key}"
+        return output_path, s3_uri
 
     except Exception as e:
         logger.exception(f"Pipeline failed due to an unexpected error {e}")
         raise
 
 
+def _ingest(client, sink, concurrency, logger):
+    """
+    Consume pages from the client and stream them into `sink`.
+
+    With `concurrency > 1` pages come from the client's concurrent async
+    iterator, otherwise from the sequential one; either way they are fetched
+    on a prefetch thread and arrive in page order, so a single consumer
+    writes every row and output ordering is preserved.
+
+    The schema is taken from the first non-empty page, in the order the API
+    returns keys, and then frozen. Fields that appear later are logged to the
+    `<logger>.schema_drift` logger and returned as schema drift rather than
+    rewriting the header.
+
+    Returns:
+        tuple: (pages requested, rows written, drifted field names)
+    """
+    pages_requested = 0
+    total_rows = 0
+    fieldnames = None
+    known_fields = None
+    drift_fields = []
+    drift_log = logger.getChild("schema_drift")
+
+    if concurrency > 1:
+        pages = client.iterate_all_pages_async(limit=1000, concurrency=concurrency)
+    else:
+        pages = client.iterate_all_pages(limit=1000)
+
+    for page_num, data in _prefetch_pages(pages):
+        pages_requested += 1
+
+        if not data:
+            logger.warning(f"Page {page_num} returned no data.")
+            continue
+
+        items = data.get("data") or []
+        if not items:
+            logger.info(f"Page {page_num} contained 0 records.")
+            continue
+
+        if fieldnames is None:
+            # --- Insertion-ordered union of keys on the first page, then freeze the schema ---
+            fieldnames = list(dict.fromkeys(chain.from_iterable(items)))
+            known_fields = set(fieldnames)
+
+            sink.start(fieldnames)
+        else:
+            # --- Schema drift: columns can't be added retroactively, so report it ---
+            for r in items:
+                new_fields = r.keys() - known_fields
+                if new_fields:
+                    drift_log.warning(
+                        f"Page {page_num} introduced fields not in the output schema: {sorted(new_fields)}"
+                    )
+                    known_fields.update(new_fields)
+                    drift_fields.extend(sorted(new_fields))
+
+        sink.write_rows(items)
+        total_rows += len(items)
+
+        logger.info(f"Page {page_num} ingested ({len(items)} records, {total_rows} total)")
+
+    sink.finish()
+
+    return pages_requested, total_rows, drift_fields
+
+
+_DONE = object()
+_FAILED = object()
+
+
+def _prefetch_pages(pages, depth=PREFETCH_PAGES):
+    """
+    Iterate `pages` (a sync or async iterable) on a background thread.
+
+    Up to `depth` pages are buffered in a bounded queue ahead of the consumer,
+    so the network stays busy while the current page is being written and
+    memory stays capped. Errors raised while fetching are re-raised here.
+    """
+    buffer = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(item):
+        # Give up if the consumer has gone away, instead of blocking forever
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    async def pump_async():
+        async for item in pages:
+            if not await asyncio.to_thread(put, item):
+                break
+
+    def producer():
+        try:
+            if hasattr(pages, "__aiter__"):
+                # libuv-backed loop when available: cheaper per-request overhead
+                (uvloop.run if uvloop else asyncio.run)(pump_async())
+            else:
+                for item in pages:
+                    if not put(item):
+                        break
+        except BaseException as e:
+            put((_FAILED, e))
+            return
+        put((_DONE, None))
+
+    threading.Thread(target=producer, name="page-prefetch", daemon=True).start()
+
+    try:
+        while True:
+            marker, payload = item = buffer.get()
+            if marker is _DONE:
+                return
+            if marker is _FAILED:
+                raise payload
+            yield item
+    finally:
+        stop.set()
+
+
+def _open_sink(fileobj, output_format, compression=None):
+    """Build the writer for `output_format` on top of a binary file-like object."""
+    if output_format == "parquet":
+        return _ParquetSink(fileobj)
+    return _CsvSink(fileobj, compression)
+
+
+class _CsvSink:
+    """
+    CSV output via the stdlib writer. Missing fields become "N/A"; rows are
+    written in batches, optionally through a streaming gzip/zstd compressor.
+    The underlying binary file object is left open for the caller.
+
+    The destination is always opened in binary mode; the only text layer is
+    a C TextIOWrapper that encodes in 8 KiB chunks with no newline
+    translation (newline=""). A hand-rolled bytes emitter measured ~4x
+    slower than csv.writer + TextIOWrapper, so keep this layering.
+    """
+
+    def __init__(self, fileobj, compression=None):
+        if compression == "gzip":
+            # level 1: most of the ratio for a fraction of the CPU
+            self._compressor = gzip.GzipFile(fileobj=fileobj, mode="wb", compresslevel=1)
+        elif compression == "zstd":
+            if zstandard is None:
+                raise ImportError("compression='zstd' requires zstandard (pip install zstandard)")
+            self._compressor = zstandard.ZstdCompressor(level=3, threads=-1).stream_writer(fileobj, closefd=False)
+        else:
+            self._compressor = None
+
+        self._text = io.TextIOWrapper(self._compressor or fileobj, encoding="utf-8", newline="")
+        self._writer = csv.writer(self._text)
+        self._field_set = None
+        self._template = None
+        self._get_row = None
+        self._batch = []
+
+    def start(self, fieldnames):
+        self._field_set = frozenset(fieldnames)
+        self._template = dict.fromkeys(fieldnames, "N/A")
+        # itemgetter fetches every column in one C call (tuple even for 1 field)
+        if len(fieldnames) == 1:
+            only = fieldnames[0]
+            self._get_row = lambda row: (row[only],)
+        else:
+            self._get_row = itemgetter(*fieldnames)
+        self._writer.writerow(fieldnames)
+
+    def write_rows(self, items):
+        # Buffer the raw records; rows are only materialized at flush time
+        self._batch.extend(items)
+        if len(self._batch) >= WRITE_BATCH_ROWS:
+            self._flush()
+
+    def finish(self):
+        if self._batch:
+            self._flush()
+
+        self._text.flush()
+        self._text.detach()
+        if self._compressor is not None:
+            self._compressor.close()  # writes the gzip trailer / zstd frame end
+
+    def _flush(self):
+        # --- Complete rows pass through untouched; incomplete ones are merged
+        # over the pre-built "N/A" template (C-level dict merge, records are not
+        # mutated). Then one writerows() over C-level itemgetter rows ---
+        field_set = self._field_set
+        template = self._template
+        rows = (row if row.keys() >= field_set else template | row for row in self._batch)
+
+        self._writer.writerows(map(self._get_row, rows))
+        self._batch.clear()
+
+
+class _RollingPartSink:
+    """
+    Split output into self-contained part files of roughly `part_size` bytes
+    under `local_dir`, uploading each one to `s3_prefix` in the background as
+    soon as it closes (at most MAX_PART_UPLOADS at a time). Each part gets its
+    own inner sink, so every part carries a header (CSV) or footer (Parquet).
+
+    Readers should treat the prefix as complete only once `_SUCCESS` exists:
+    `finish()` writes it after every part uploaded, and `abort()` (or a failed
+    part upload) deletes the parts already uploaded instead.
+
+    `success` is set by `finish()`: True/False for the upload outcome, or
+    None if no rows arrived and nothing was uploaded.
+    """
+
+    SUCCESS_MARKER = "_SUCCESS"
+
+    def __init__(self, local_dir, extension, open_part_sink, uploader, bucket, s3_prefix, part_size, extra_args=None):
+        os.makedirs(local_dir, exist_ok=True)
+        self._local_dir = local_dir
+        self._extension = extension
+        self._open_part_sink = open_part_sink
+        self._uploader = uploader
+        self._bucket = bucket
+        self._s3_prefix = s3_prefix
+        self._part_size = part_size
+        self._extra_args = extra_args
+
+        self._fieldnames = None
+        self._part_num = 0
+        self._file = None
+        self._sink = None
+        self._executor = ThreadPoolExecutor(max_workers=MAX_PART_UPLOADS, thread_name_prefix="part-upload")
+        self._uploads = []
+        self.success = False
+
+    def start(self, fieldnames):
+        self._fieldnames = fieldnames
+
+    def write_rows(self, items):
+        if self._sink is None:
+            self._open_part()
+        self._sink.write_rows(items)
+        if self._file.tell() >= self._part_size:
+            self._close_part()
+
+    def finish(self):
+        if self._sink is not None:
+            self._close_part()
+        self._executor.shutdown(wait=True)
+
+        if not self._uploads:
+            self.success = None
+            return
+
+        if not all(upload.result() for _, upload in self._uploads):
+            self._delete_uploaded()
+            self.success = False
+            return
+
+        self.success = self._uploader.upload_fileobj(
+            io.BytesIO(b""), self._bucket, f"{self._s3_prefix}/{self.SUCCESS_MARKER}"
+        )
+        if not self.success:
+            self._delete_uploaded()
+
+    def abort(self):
+        """Stop after a failed ingestion: cancel queued uploads and delete finished ones."""
+        if self._file is not None:
+            self._file.close()
+            self._file = self._sink = None
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._delete_uploaded()
+        self.success = False
+
+    def _delete_uploaded(self):
+        for key, upload in self._uploads:
+            if not upload.cancelled() and upload.exception() is None and upload.result():
+                self._uploader.delete(self._bucket, key)
+
+    def _open_part(self):
+        self._part_num += 1
+        path = os.path.join(self._local_dir, f"part-{self._part_num:05d}.{self._extension}")
+        self._file = open(path, "wb", buffering=WRITE_BUFFER_SIZE)
+        self._sink = self._open_part_sink(self._file)
+        self._sink.start(self._fieldnames)
+
+    def _close_part(self):
+        self._sink.finish()
+        self._file.close()
+
+        path = self._file.name
+        key = f"{self._s3_prefix}/{os.path.basename(path)}"
+        upload = self._executor.submit(
+            self._uploader.upload_file, local_path=path, bucket=self._bucket, key=key, extra_args=self._extra_args
+        )
+        self._uploads.append((key, upload))
+        self._file = self._sink = None
+
+
+class _ParquetSink:
+    """
+    Parquet output (zstd) via pyarrow, one row group per batch.
+
+    Every field is stored as a nullable string: the raw payload mixes types
+    (e.g. "N/A" in numeric fields) and cleaning happens downstream (ELT).
+    Missing fields are null rather than "N/A".
+    """
+
+    def __init__(self, fileobj):
+        if pa is None:
+            raise ImportError("output_format='parquet' requires pyarrow (pip install pyarrow)")
+        self._fileobj = fileobj
+        self._fieldnames = None
+        self._schema = None
+        self._writer = None
+        self._batch = []
+
+    def start(self, fieldnames):
+        self._fieldnames = fieldnames
+        self._schema = pa.schema([(name, pa.string()) for name in fieldnames])
+        self._writer = pq.ParquetWriter(self._fileobj, self._schema, compression="zstd")
+
+    def write_rows(self, items):
+        self._batch.extend(items)
+        if len(self._batch) >= WRITE_BATCH_ROWS:
+            self._flush()
+
+    def finish(self):
+        if self._writer is None:
+            # No rows: still write a valid (column-less) file with a footer
+            self.start([])
+        if self._batch:
+            self._flush()
+        self._writer.close()
+
+    def _flush(self):
+        columns = {
+            name: [None if (value := row.get(name)) is None else str(value) for row in self._batch]
+            for name in self._fieldnames
+        }
+        self._writer.write_table(pa.table(columns, schema=self._schema))
+        self._batch.clear()
+
+
+def _strip_output_extension(filename):
+    """Drop a trailing output extension (.csv, .parquet, optionally .gz/.zst)."""
+    for fmt in OUTPUT_FORMATS:
+        for suffix in COMPRESSION_SUFFIXES.values():
+            ending = f".{fmt}{suffix}"
+            if filename.endswith(ending):
+                return filename[:-len(ending)]
+    return filename
+
+
 def _generate_report(
     pages_requested,
     successful_pages,
@@ -173,9 +640,11 @@ def _generate_report(
     total_retries,
     records_ingested,
     execution_time,
-    csv_path,
+    output_path,
     report_path,
-    logger
+    logger,
+    output_format="csv",
+    schema_drift=None
 ):
     """Writes a simple ingestion report."""
     logger.info("Generating report...")
@@ -189,10 +658,13 @@ def _generate_report(
         f"Total Retries: {total_retries}\n"
         f"Records Ingested: {records_ingested:,}\n"
         f"Execution Time: {_format_execution_time(execution_time)}\n"
-        f"CSV Output: {csv_path}\n"
-        "Format Chosen: CSV (Reason: Streaming efficiency)\n"
+        f"{output_format.upper()} Output: {output_path}\n"
+        f"Format Chosen: {FORMAT_REASONS[output_format]}\n"
     )
 
+    if schema_drift:
+        report_text += f"Schema Drift (fields not in output schema): {', '.join(schema_drift)}\n"
+
     with open(report_path, "w") as f:
         f.write(report_text)
 
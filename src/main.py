@@ -6,7 +6,9 @@ This module performs the following functions:
 1. Loads environment variables from a .env file, including:
 - AWS profile and S3 destinations
 - API endpoints and authentication credentials
-- Output CSV and report filenames
+- Output CSV and report filenames (OUTPUT_FORMAT=parquet switches to Parquet,
+  COMPRESSION=gzip|zstd compresses CSV output, PART_SIZE_MB rolls the output
+  into parts uploaded while ingestion continues)
 
 2. Initializes the application logger.
 
@@ -14,7 +16,7 @@ This module performs the following functions:
 - Authenticates with the unstable API
 - Iteratively retrieves all pages of customer data
 - Streams records into a CSV file (memory-efficient)
-- Uploads the CSV to S3
+- Uploads the CSV to S3 (or streams it there directly when STREAM_UPLOAD=true)
 - Generates an ingestion summary report
 
 4. Logs the final output path of the generated CSV.
@@ -47,6 +49,11 @@ def main():
     csv_filename = os.getenv("CSV_FILENAME")
     report_filename = os.getenv("REPORT_FILENAME")
 
+    stream_upload = os.getenv("STREAM_UPLOAD", "false").lower() == "true"
+    output_format = os.getenv("OUTPUT_FORMAT", "csv").lower()
+    compression = os.getenv("COMPRESSION") or None
+    part_size_mb = os.getenv("PART_SIZE_MB")
+
     output_path = run_ingestion_pipeline(
         bucket,
         s3_key,
@@ -55,7 +62,11 @@ def main():
         username,
         password,
         csv_filename,
-        report_filename
+        report_filename,
+        stream_upload=stream_upload,
+        output_format=output_format,
+        compression=compression,
+        part_size=int(part_size_mb) * 1024 * 1024 if part_size_mb else None
     )
 
     logger.info(f"Ingestion completed. CSV saved locally at: {output_path}")
@@ -1,10 +1,19 @@
+import base64
+import json
+import threading
 import time
 import requests
 
+REFRESH_MARGIN_SECONDS = 60
+
 
 class AuthClient:
     """
     Handles authentication & token refresh for an API.
+
+    The bearer token is cached and proactively refreshed shortly before it
+    expires. Refreshes are single-flight: a lock ensures concurrent callers
+    (threads or concurrent page fetches) trigger one login, not a stampede.
     """
 
     def __init__(self, auth_url, username, password, logger, timeout=10):
@@ -16,10 +25,12 @@ class AuthClient:
         self.logger = logger
         self.access_token = None
         self.expires_at = 0  # epoch timestamp
+        self.refresh_at = 0  # epoch timestamp; proactive refresh point before expiry
+        self._lock = threading.Lock()
 
     def _is_token_expired(self):
-        """Check if token is missing or expired."""
-        return not self.access_token or time.time() >= self.expires_at
+        """Check if token is missing, expired, or about to expire."""
+        return not self.access_token or time.time() >= self.refresh_at
 
     def _request_new_token(self):
         """Request a new access token from the auth endpoint."""
@@ -37,8 +48,16 @@ class AuthClient:
             response.raise_for_status()
             data = response.json()
 
+            now = time.time()
             self.access_token = data["access_token"]
-            self.expires_at = time.time() + data.get("expires_in", 3600) - 30
+            if "expires_in" in data:
+                self.expires_at = now + data["expires_in"]
+            else:
+                self.expires_at = self._jwt_expiry(self.access_token) or now + 3600
+
+            # Refresh 60s early (or halfway, for very short-lived tokens)
+            lifetime = max(self.expires_at - now, 0)
+            self.refresh_at = self.expires_at - min(REFRESH_MARGIN_SECONDS, lifetime / 2)
 
             self.logger.info("Authentication successful.")
 
@@ -46,11 +65,40 @@ class AuthClient:
             self.logger.error(f"Authentication failed: {e}")
             raise
 
+    @staticmethod
+    def _jwt_expiry(token):
+        """Read the `exp` claim from a JWT payload (no signature check). None if absent."""
+        try:
+            payload = token.split(".")[1]
+            payload += "=" * (-len(payload) % 4)
+            return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+        except (IndexError, KeyError, TypeError, ValueError):
+            return None
+
     def get_token(self):
         """Returns a fresh token. Refreshes automatically if expired."""
-        if self._is_token_expired():
-            self._request_new_token()
-        return self.access_token
+        # Read the token once: a concurrent invalidate() may reset the attribute
+        token = self.access_token
+        if token and time.time() < self.refresh_at:
+            return token
+
+        with self._lock:
+            # Another caller may have refreshed while we waited
+            if self._is_token_expired():
+                self._request_new_token()
+            return self.access_token
+
+    def invalidate(self, rejected_header=None):
+        """
+        Drop the cached token, e.g. after a 401. Pass the header that was
+        rejected: if the token has already been replaced since, this is a
+        no-op, so concurrent 401s cause a single re-login.
+        """
+        with self._lock:
+            if rejected_header is None or rejected_header == {"Authorization": f"Bearer {self.access_token}"}:
+                self.access_token = None
+                self.expires_at = 0
+                self.refresh_at = 0
 
     def get_auth_header(self):
         """Helper that returns the Authorization header dict."""
@@ -1,6 +1,35 @@
+import functools
+import queue
+from concurrent.futures import ThreadPoolExecutor
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+MB = 1024 * 1024
+
+
+@functools.lru_cache(maxsize=8)
+def _get_session(
+    aws_profile: str | None = None,
+    aws_access_key: str | None = None,
+    aws_secret_key: str | None = None,
+    region_name: str | None = None
+) -> boto3.Session:
+    """
+    Return a boto3 Session, cached per credential source + region.
+
+    Building a Session loads credentials, parses ~/.aws config files and sets
+    up the endpoint resolver (tens to hundreds of ms), so repeated
+    S3FileClient instantiations reuse it instead.
+    """
+    return boto3.Session(
+        aws_access_key_id=aws_access_key,
+        aws_secret_access_key=aws_secret_key,
+        profile_name=aws_profile,
+        region_name=region_name
+    )
+
 
 class S3FileClient:
     """
@@ -12,8 +41,10 @@ class S3FileClient:
     3. Default AWS credential chain (env vars, EC2/ECS role, etc.)
 
     Supports:
-    - Uploading files from disk
+    - Uploading files from disk (multipart, tuned part size + concurrency)
+    - Streaming uploads from file-like objects (no local file needed)
     - Downloading files to disk
+    - Deleting objects
     - Checking if an S3 object exists
     """
 
@@ -23,7 +54,9 @@ class S3FileClient:
         aws_profile: str | None = None,
         aws_access_key: str | None = None,
         aws_secret_key: str | None = None,
-        region_name: str | None = None
+        region_name: str | None = None,
+        multipart_chunksize: int = 16 * MB,
+        max_concurrency: int = 16
     ):
         """
         Initialize the S3 client using the strongest available authentication method.
@@ -40,6 +73,12 @@ class S3FileClient:
             Explicit AWS secret access key.
         region_name : str, optional
             AWS region to use for the S3 client.
+        multipart_chunksize : int, optional
+            Part size in bytes for multipart uploads (default 16 MiB, which
+            matches AWS's recommended byte-range GET size, so downstream
+            ranged reads line up with part boundaries).
+        max_concurrency : int, optional
+            Number of parts uploaded in parallel (default 16).
 
         Notes
         -----
@@ -51,17 +90,31 @@ class S3FileClient:
         self.logger = logger
         self.region_name = region_name
 
+        # Files above 16 MiB go multipart; parts are PUT in parallel
+        self._transfer_config = TransferConfig(
+            multipart_threshold=16 * MB,
+            multipart_chunksize=multipart_chunksize,
+            max_concurrency=max_concurrency,
+            use_threads=True
+        )
+        # Connection pool sized for parallel part uploads (botocore default is 10)
+        client_config = Config(
+            tcp_keepalive=True,
+            max_pool_connections=max(32, max_concurrency),
+            retries={"max_attempts": 10, "mode": "adaptive"}
+        )
+
         # ------------------------------
         # 1. Explicit Access Keys
         # ------------------------------
         if aws_access_key and aws_secret_key:
             self.logger.info("Initializing S3 client with explicit AWS credentials.")
-            session = boto3.Session(
-                aws_access_key_id=aws_access_key,
-                aws_secret_access_key=aws_secret_key,
+            session = _get_session(
+                aws_access_key=aws_access_key,
+                aws_secret_key=aws_secret_key,
                 region_name=region_name
             )
-            self.s3 = session.client("s3")
+            self.s3 = session.client("s3", config=client_config)
             return
 
         # ------------------------------
@@ -69,20 +122,20 @@ class S3FileClient:
         # ------------------------------
         if aws_profile:
             self.logger.info(f"Initializing S3 client using AWS profile: {aws_profile}")
-            session = boto3.Session(profile_name=aws_profile, region_name=region_name)
-            self.s3 = session.client("s3")
+            session = _get_session(aws_profile=aws_profile, region_name=region_name)
+            self.s3 = session.client("s3", config=client_config)
             return
 
         # ------------------------------
         # 3. Default AWS Credential Chain
         # ------------------------------
         self.logger.info("Initializing S3 client using default AWS credential chain.")
-        self.s3 = boto3.client("s3", region_name=region_name)
+        self.s3 = _get_session(region_name=region_name).client("s3", config=client_config)
 
     # -------------------------------------------------------------------------
     # Upload
     # -------------------------------------------------------------------------
-    def upload_file(self, local_path: str, bucket: str, key: str) -> bool:
+    def upload_file(self, local_path: str, bucket: str, key: str, extra_args: dict | None = None) -> bool:
         """
         Upload a local file to an S3 bucket.
 
@@ -94,6 +147,8 @@ class S3FileClient:
             Name of the S3 bucket.
         key : str
             Full S3 object key (path inside the bucket).
+        extra_args : dict, optional
+            Extra object parameters, e.g. ``{"ContentEncoding": "gzip"}``.
 
         Returns
         -------
@@ -102,12 +157,75 @@ class S3FileClient:
         """
         try:
             self.logger.info(f"Uploading {local_path} → s3://{bucket}/{key}")
-            self.s3.upload_file(local_path, bucket, key)
+            self.s3.upload_file(local_path, bucket, key, ExtraArgs=extra_args, Config=self._transfer_config)
+            return True
+        except ClientError as e:
+            self.logger.error(f"S3 upload failed: {e}", exc_info=True)
+            return False
+
+    # -------------------------------------------------------------------------
+    # Streaming upload
+    # -------------------------------------------------------------------------
+    def upload_fileobj(
+        self,
+        fileobj,
+        bucket: str,
+        key: str,
+        config: TransferConfig | None = None,
+        extra_args: dict | None = None
+    ) -> bool:
+        """
+        Upload a readable file-like object to an S3 bucket.
+
+        Parameters
+        ----------
+        fileobj : file-like
+            Object exposing ``read(size)``; it does not need to be seekable.
+        bucket : str
+            Name of the S3 bucket.
+        key : str
+            Full S3 object key (path inside the bucket).
+        config : TransferConfig, optional
+            Transfer settings; defaults to the client's multipart config.
+        extra_args : dict, optional
+            Extra object parameters, e.g. ``{"ContentEncoding": "gzip"}``.
+
+        Returns
+        -------
+        bool
+            True if the upload succeeds, False if an S3 error occurs.
+        """
+        try:
+            self.logger.info(f"Streaming upload → s3://{bucket}/{key}")
+            self.s3.upload_fileobj(
+                fileobj, bucket, key, ExtraArgs=extra_args, Config=config or self._transfer_config
+            )
             return True
         except ClientError as e:
             self.logger.error(f"S3 upload failed: {e}", exc_info=True)
             return False
 
+    def open_upload_stream(self, bucket: str, key: str, extra_args: dict | None = None) -> "S3UploadStream":
+        """
+        Open a writable stream whose bytes are uploaded to S3 as they are written.
+
+        Parameters
+        ----------
+        bucket : str
+            Name of the S3 bucket.
+        key : str
+            Full S3 object key (path inside the bucket).
+        extra_args : dict, optional
+            Extra object parameters, e.g. ``{"ContentEncoding": "gzip"}``.
+
+        Returns
+        -------
+        S3UploadStream
+            Binary sink; call ``close()`` to finish the upload or ``abort()``
+            to discard it.
+        """
+        return S3UploadStream(self, bucket, key, extra_args=extra_args)
+
     # -------------------------------------------------------------------------
     # Download
     # -------------------------------------------------------------------------
@@ -137,6 +255,33 @@ class S3FileClient:
             self.logger.error(f"S3 download failed: {e}", exc_info=True)
             return False
 
+    # -------------------------------------------------------------------------
+    # Delete
+    # -------------------------------------------------------------------------
+    def delete(self, bucket: str, key: str) -> bool:
+        """
+        Delete an S3 object.
+
+        Parameters
+        ----------
+        bucket : str
+            Name of the S3 bucket.
+        key : str
+            Key of the S3 object to delete.
+
+        Returns
+        -------
+        bool
+            True if the delete succeeds, False if an S3 error occurs.
+        """
+        try:
+            self.logger.info(f"Deleting s3://{bucket}/{key}")
+            self.s3.delete_object(Bucket=bucket, Key=key)
+            return True
+        except ClientError as e:
+            self.logger.error(f"S3 delete failed: {e}", exc_info=True)
+            return False
+
     # -------------------------------------------------------------------------
     # Exists
     # -------------------------------------------------------------------------
@@ -161,3 +306,132 @@ class S3FileClient:
             return True
         except ClientError:
             return False
+
+
+class S3UploadStream:
+    """
+    Write-only binary sink that streams into an S3 multipart upload.
+
+    Written bytes are batched into buffers and handed through a bounded queue
+    to a background ``upload_fileobj`` call, which reads them back as a
+    non-seekable stream. Parts are therefore PUT while the producer is still
+    writing, and the data never touches local disk.
+
+    The queue bound (``max_buffers``) caps memory: a producer that outruns the
+    network blocks on ``write`` until the uploader catches up.
+    """
+
+    _EOF = None
+    _ABORT = object()
+
+    def __init__(
+        self,
+        client: S3FileClient,
+        bucket: str,
+        key: str,
+        buffer_size: int = 8 * MB,
+        max_buffers: int = 4,
+        extra_args: dict | None = None
+    ):
+        self.uri = f"s3://{bucket}/{key}"
+        self.closed = False
+
+        self._buffer = bytearray()
+        self._buffer_size = buffer_size
+        self._position = 0
+        self._queue = queue.Queue(maxsize=max_buffers)
+        self._pending = b""
+        self._eof = False
+
+        config = TransferConfig(
+            multipart_threshold=16 * MB,
+            multipart_chunksize=16 * MB,
+            max_concurrency=8,
+            use_threads=True
+        )
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._future = self._executor.submit(client.upload_fileobj, self, bucket, key, config, extra_args)
+
+    # ---- producer side -------------------------------------------------------
+    def write(self, data: bytes) -> int:
+        """Buffer bytes, handing full buffers to the uploader."""
+        if self.closed:
+            raise ValueError("write to closed S3UploadStream")
+
+        self._buffer += data
+        self._position += len(data)
+        if len(self._buffer) >= self._buffer_size:
+            if not self._put(bytes(self._buffer)):
+                raise OSError(f"Upload to {self.uri} stopped before the stream was closed")
+            self._buffer.clear()
+        return len(data)
+
+    def flush(self):
+        """No-op: buffers are handed off once full or on close."""
+
+    def writable(self) -> bool:
+        return not self.closed
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def tell(self) -> int:
+        """Bytes written so far (needed by writers such as pyarrow's ParquetWriter)."""
+        return self._position
+
+    def close(self) -> bool:
+        """Flush remaining bytes, wait for the upload, and return its outcome."""
+        if not self.closed:
+            self.closed = True
+            if self._buffer and self._put(bytes(self._buffer)):
+                self._buffer.clear()
+            self._put(self._EOF)
+            self._executor.shutdown(wait=True)
+        return self._future.result()
+
+    def abort(self):
+        """Stop the upload without completing it (no partial object is created)."""
+        if not self.closed:
+            self.closed = True
+            self._put(self._ABORT)
+            self._executor.shutdown(wait=True)
+
+    def _put(self, item) -> bool:
+        """Enqueue without blocking forever if the uploader has already stopped."""
+        while True:
+            try:
+                self._queue.put(item, timeout=1)
+                return True
+            except queue.Full:
+                if self._future.done():
+                    return False
+
+    # ---- consumer side (called by boto3 in the upload thread) ----------------
+    def read(self, size: int = -1) -> bytes:
+        chunks = []
+        remaining = size
+
+        while remaining != 0 and not self._eof:
+            if not self._pending:
+                item = self._queue.get()
+                if item is self._ABORT:
+                    self._eof = True
+                    raise OSError(f"Upload to {self.uri} aborted")
+                if item is self._EOF:
+                    self._eof = True
+                    break
+                self._pending = item
+
+            if remaining < 0 or remaining >= len(self._pending):
+                chunk, self._pending = self._pending, b""
+            else:
+                chunk, self._pending = self._pending[:remaining], self._pending[remaining:]
+
+            chunks.append(chunk)
+            if remaining > 0:
+                remaining -= len(chunk)
+
+        return b"".join(chunks)
@@ -1,6 +1,11 @@
+import asyncio
 import time
 import random
+from collections import deque
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 
 class UnstableAPIClient:
@@ -11,6 +16,8 @@ class UnstableAPIClient:
         - rate-limit handling
         - transient 500/503 failures
         - pagination sequencing
+        - concurrent page retrieval (asyncio + aiohttp)
+        - pooled keep-alive connections (one requests.Session per client)
     """
 
 
@@ -30,6 +37,18 @@ class UnstableAPIClient:
         self.timeout = timeout
         self.jitter = jitter
 
+        # Persistent session: reuses TCP/TLS connections across pages.
+        # The adapter only retries connection setup; status-code retries stay
+        # in _retry_request so retry_count in the report remains accurate.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(connect=3, read=False, backoff_factor=0.5)
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
         # tracking fields
         self.retry_count = 0
         self.successful_pages = 0
@@ -55,50 +74,53 @@ class UnstableAPIClient:
     # ---------------------------------------------------------
     def _retry_request(self, url, params):
         attempts = 0
+        reauthenticated = False
 
         while attempts <= self.max_retries:
             try:
-                response = requests.get(
+                headers = self.auth_client.get_auth_header()
+                with self.session.get(
                     url,
-                    headers=self.auth_client.get_auth_header(),
+                    headers=headers,
                     params=params,
                     timeout=self.timeout
-                )
-
-                # SUCCESS
-                if response.status_code == 200:
-                    return response.json()
-
-                # RATE LIMITED (429)
-                if response.status_code == 429:
-                    self.retry_count += 1
-                    wait = 2 ** attempts
-                    if self.jitter:
-                        wait += random.uniform(0, 1)
-                    self.logger.warning(f"Rate limited: retrying in {wait:.2f}s...")
-                    time.sleep(wait)
-                    attempts += 1
-                    continue
-
-                # SERVER FAILURE (500 or 503)
-                if response.status_code in (500, 503):
-                    self.retry_count += 1
-                    wait = 2 ** attempts
-                    if self.jitter:
-                        wait += random.uniform(0, 1)
-                    self.logger.error(f"Server error {response.status_code}: retrying in {wait:.2f}s...")
-                    time.sleep(wait)
-                    attempts += 1
-                    continue
-
-                # NON-RETRYABLE ERROR
-                response.raise_for_status()
+                ) as response:
+
+                    # SUCCESS
+                    if response.status_code == 200:
+                        return response.json()
+
+                    # UNAUTHORIZED (401): token revoked/expired early → re-login once
+                    if response.status_code == 401 and not reauthenticated:
+                        self.logger.warning("Unauthorized: refreshing token and retrying once...")
+                        self.auth_client.invalidate(headers)
+                        reauthenticated = True
+                        continue
+
+                    # RATE LIMITED (429)
+                    if response.status_code == 429:
+                        self.retry_count += 1
+                        wait = self._backoff(attempts)
+                        self.logger.warning(f"Rate limited: retrying in {wait:.2f}s...")
+                        time.sleep(wait)
+                        attempts += 1
+                        continue
+
+                    # SERVER FAILURE (500 or 503)
+                    if response.status_code in (500, 503):
+                        self.retry_count += 1
+                        wait = self._backoff(attempts)
+                        self.logger.error(f"Server error {response.status_code}: retrying in {wait:.2f}s...")
+                        time.sleep(wait)
+                        attempts += 1
+                        continue
+
+                    # NON-RETRYABLE ERROR
+                    response.raise_for_status()
 
             except requests.RequestException as e:
                 self.retry_count += 1
-                wait = 2 ** attempts
-                if self.jitter:
-                    wait += random.uniform(0, 1)
+                wait = self._backoff(attempts)
                 self.logger.error(f"Request failed: {e}, retrying in {wait:.2f}s...")
                 time.sleep(wait)
                 attempts += 1
@@ -107,6 +129,13 @@ class UnstableAPIClient:
         self.logger.error(f"Max retries exceeded for page params: {params}")
         return None
 
+    def _backoff(self, attempts):
+        """Exponential backoff (2^attempts seconds) plus optional jitter."""
+        wait = 2 ** attempts
+        if self.jitter:
+            wait += random.uniform(0, 1)
+        return wait
+
     # ---------------------------------------------------------
     # 3. Generator for all pages (lazy iteration)
     # ---------------------------------------------------------
@@ -148,3 +177,143 @@ class UnstableAPIClient:
             self.records_ingested += len(result["data"])
 
             yield (page, result)
+
+    # ---------------------------------------------------------
+    # 4. Async fetch of a single page (same retry semantics)
+    # ---------------------------------------------------------
+    async def fetch_page_async(self, session, page, limit=1000):
+        """
+        Async counterpart of `fetch_page`, using a shared aiohttp session.
+        Returns:
+            dict -> parsed JSON data (metadata + records), or None on failure
+        """
+        url = f"{self.base_url}"
+        params = {"page": page, "limit": limit}
+
+        return await self._retry_request_async(session, url, params)
+
+    async def _retry_request_async(self, session, url, params):
+        attempts = 0
+        reauthenticated = False
+
+        while attempts <= self.max_retries:
+            try:
+                # token refresh does blocking HTTP; keep it off the event loop
+                headers = await asyncio.to_thread(self.auth_client.get_auth_header)
+                async with session.get(url, headers=headers, params=params) as response:
+
+                    # SUCCESS
+                    if response.status == 200:
+                        # content_type=None: accept JSON regardless of the header, like requests
+                        return await response.json(content_type=None)
+
+                    # UNAUTHORIZED (401): token revoked/expired early → re-login once
+                    if response.status == 401 and not reauthenticated:
+                        self.logger.warning("Unauthorized: refreshing token and retrying once...")
+                        await asyncio.to_thread(self.auth_client.invalidate, headers)
+                        reauthenticated = True
+                        continue
+
+                    # RATE LIMITED (429)
+                    if response.status == 429:
+                        self.retry_count += 1
+                        wait = self._backoff(attempts)
+                        self.logger.warning(f"Rate limited: retrying in {wait:.2f}s...")
+                        await asyncio.sleep(wait)
+                        attempts += 1
+                        continue
+
+                    # SERVER FAILURE (500 or 503)
+                    if response.status in (500, 503):
+                        self.retry_count += 1
+                        wait = self._backoff(attempts)
+                        self.logger.error(f"Server error {response.status}: retrying in {wait:.2f}s...")
+                        await asyncio.sleep(wait)
+                        attempts += 1
+                        continue
+
+                    # NON-RETRYABLE ERROR
+                    response.raise_for_status()
+
+            # RequestException: a failed token refresh; ValueError: malformed JSON body
+            except (aiohttp.ClientError, asyncio.TimeoutError, requests.RequestException, ValueError) as e:
+                self.retry_count += 1
+                wait = self._backoff(attempts)
+                self.logger.error(f"Request failed: {e}, retrying in {wait:.2f}s...")
+                await asyncio.sleep(wait)
+                attempts += 1
+
+        # FAILED ALL RETRIES
+        self.logger.error(f"Max retries exceeded for page params: {params}")
+        return None
+
+    # ---------------------------------------------------------
+    # 5. Async generator for all pages (concurrent, in order)
+    # ---------------------------------------------------------
+    async def iterate_all_pages_async(self, limit=1000, concurrency=16):
+        """
+        Async counterpart of `iterate_all_pages`.
+
+        Fetches page 1 to learn `total_pages`, then keeps up to `concurrency`
+        requests in flight. Pages are still yielded in page order, and at most
+        `2 * concurrency` fetched-but-unconsumed pages are buffered, so memory
+        stays bounded even when the consumer is slower than the network.
+        """
+        # Keep-alive pool sized for the in-flight window; the session-wide
+        # timeout replaces a per-request ClientTimeout allocation.
+        connector = aiohttp.TCPConnector(
+            limit=max(32, concurrency),
+            limit_per_host=max(32, concurrency),
+            keepalive_timeout=60
+        )
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            page = 1
+
+            # Fetch first page
+            first = await self.fetch_page_async(session, page, limit)
+            if not first:
+                self.logger.error("Failed to fetch the first page — cannot continue.")
+                self.failed_pages += 1
+                return
+
+            total_pages = first["metadata"]["total_pages"]
+
+            # Track success & records
+            self.successful_pages += 1
+            self.records_ingested += len(first["data"])
+
+            # Yield first
+            yield (page, first)
+
+            semaphore = asyncio.BoundedSemaphore(concurrency)
+
+            async def fetch(page_num):
+                async with semaphore:
+                    return await self.fetch_page_async(session, page_num, limit)
+
+            # Remaining pages: sliding window of scheduled fetches
+            pending = deque()
+            next_page = 2
+            try:
+                while next_page <= total_pages or pending:
+                    while next_page <= total_pages and len(pending) < 2 * concurrency:
+                        pending.append((next_page, asyncio.ensure_future(fetch(next_page))))
+                        next_page += 1
+
+                    page, task = pending.popleft()
+                    result = await task
+
+                    if result is None:
+                        self.failed_pages += 1
+                        yield (page, None)
+                        continue
+
+                    self.successful_pages += 1
+                    self.records_ingested += len(result["data"])
+
+                    yield (page, result)
+            finally:
+                for _, task in pending:
+                    task.cancel()
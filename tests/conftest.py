@@ -0,0 +1,27 @@
+import logging
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from src.utils.s3_client import S3FileClient
+
+BUCKET = "test-bucket"
+REGION = "us-west-2"
+
+
+@pytest.fixture
+def s3_client(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    with mock_aws():
+        boto3.client("s3", region_name=REGION).create_bucket(
+            Bucket=BUCKET,
+            CreateBucketConfiguration={"LocationConstraint": REGION}
+        )
+        yield S3FileClient(
+            logging.getLogger("test"),
+            aws_access_key="testing",
+            aws_secret_key="testing",
+            region_name=REGION
+        )
@@ -0,0 +1,126 @@
+import base64
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+
+from src.utils import auth_client
+from src.utils.auth_client import REFRESH_MARGIN_SECONDS, AuthClient
+
+
+def _jwt(claims):
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"=").decode()
+    return f"header.{payload}.signature"
+
+
+@pytest.fixture
+def login(monkeypatch):
+    """Mock `requests.post` for /login; set `login.tokens` to the bodies to hand out."""
+    post = mock.Mock()
+    post.tokens = []
+
+    def fake_post(url, json, timeout):
+        post(url, json=json, timeout=timeout)
+        response = mock.Mock()
+        response.json.return_value = post.tokens[min(post.call_count, len(post.tokens)) - 1]
+        return response
+
+    monkeypatch.setattr(auth_client.requests, "post", fake_post)
+    return post
+
+
+@pytest.fixture
+def auth():
+    return AuthClient("http://auth/login", "user", "pass", logging.getLogger("test"))
+
+
+def test_concurrent_callers_trigger_one_login(auth, login, monkeypatch):
+    login.tokens = [{"access_token": "token-1", "expires_in": 3600}]
+
+    # Hold the first login open until every caller is waiting on the lock
+    release = threading.Event()
+    request_new_token = auth._request_new_token
+
+    def slow_request_new_token():
+        release.wait(timeout=5)
+        request_new_token()
+
+    monkeypatch.setattr(auth, "_request_new_token", slow_request_new_token)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(auth.get_token) for _ in range(8)]
+        time.sleep(0.1)
+        release.set()
+        tokens = [future.result() for future in futures]
+
+    assert tokens == ["token-1"] * 8
+    assert login.call_count == 1
+
+
+def test_token_refreshed_before_expiry(auth, login, monkeypatch):
+    login.tokens = [
+        {"access_token": "token-1", "expires_in": 3600},
+        {"access_token": "token-2", "expires_in": 3600},
+    ]
+    now = 1_000_000.0
+    monkeypatch.setattr(auth_client.time, "time", lambda: now)
+
+    assert auth.get_token() == "token-1"
+    assert auth.refresh_at == now + 3600 - REFRESH_MARGIN_SECONDS
+
+    now += 3600 - REFRESH_MARGIN_SECONDS - 1
+    assert auth.get_token() == "token-1"
+
+    now += 1
+    assert auth.get_token() == "token-2"
+    assert login.call_count == 2
+
+
+def test_short_lived_token_refreshed_halfway(auth, login, monkeypatch):
+    login.tokens = [{"access_token": "token-1", "expires_in": 30}]
+    monkeypatch.setattr(auth_client.time, "time", lambda: 1_000_000.0)
+
+    auth.get_token()
+
+    assert auth.refresh_at == 1_000_000.0 + 15
+
+
+def test_expiry_falls_back_to_jwt_exp(auth, login, monkeypatch):
+    login.tokens = [{"access_token": _jwt({"exp": 1_000_600})}]
+    monkeypatch.setattr(auth_client.time, "time", lambda: 1_000_000.0)
+
+    auth.get_token()
+
+    assert auth.expires_at == 1_000_600
+    assert auth.refresh_at == 1_000_600 - REFRESH_MARGIN_SECONDS
+
+
+@pytest.mark.parametrize("token, expected", [
+    (_jwt({"exp": 1700000000}), 1700000000.0),
+    (_jwt({"sub": "user"}), None),
+    ("opaque-token", None),
+    ("a.not-base64!.c", None),
+])
+def test_jwt_expiry(token, expected):
+    assert AuthClient._jwt_expiry(token) == expected
+
+
+def test_invalidate_with_stale_header_is_noop(auth, login):
+    login.tokens = [
+        {"access_token": "token-1", "expires_in": 3600},
+        {"access_token": "token-2", "expires_in": 3600},
+    ]
+    stale = auth.get_auth_header()
+
+    # The first 401 replaces the token; a second 401 for the same request must not
+    auth.invalidate(stale)
+    current = auth.get_auth_header()
+    auth.invalidate(stale)
+
+    assert current == {"Authorization": "Bearer token-2"}
+    assert auth.get_auth_header() == current
+    assert login.call_count == 2
@@ -0,0 +1,93 @@
+import io
+
+import pyarrow.parquet as pq
+import pytest
+
+import src.ingest as ingest
+from src.ingest import _ParquetSink, _RollingPartSink, _open_sink
+from tests.conftest import BUCKET
+
+PREFIX = "raw/unstable_raw_2025-01-01_00-00-00"
+FIELDNAMES = ["id", "name"]
+
+
+def _rows(start, count=3):
+    return [{"id": i, "name": f"Customer_{i}"} for i in range(start, start + count)]
+
+
+def _keys(client):
+    response = client.s3.list_objects_v2(Bucket=BUCKET, Prefix=PREFIX)
+    return sorted(obj["Key"].rsplit("/", 1)[1] for obj in response.get("Contents", []))
+
+
+@pytest.fixture
+def part_sink(s3_client, tmp_path, monkeypatch):
+    # One row group per write_rows call, so every call reaches the file and rolls a part
+    monkeypatch.setattr(ingest, "WRITE_BATCH_ROWS", 1)
+    sink = _RollingPartSink(
+        str(tmp_path),
+        "parquet",
+        open_part_sink=lambda fileobj: _open_sink(fileobj, "parquet"),
+        uploader=s3_client,
+        bucket=BUCKET,
+        s3_prefix=PREFIX,
+        part_size=1
+    )
+    sink.start(FIELDNAMES)
+    return sink
+
+
+def test_parquet_sink_without_rows_writes_valid_file():
+    buffer = io.BytesIO()
+    _ParquetSink(buffer).finish()
+
+    buffer.seek(0)
+    assert pq.read_table(buffer).num_rows == 0
+
+
+def test_rolling_parts_upload_each_part_then_success_marker(part_sink, s3_client):
+    for page in range(3):
+        part_sink.write_rows(_rows(page * 3))
+    part_sink.finish()
+
+    assert part_sink.success is True
+    assert _keys(s3_client) == ["_SUCCESS", "part-00001.parquet", "part-00002.parquet", "part-00003.parquet"]
+    body = s3_client.s3.get_object(Bucket=BUCKET, Key=f"{PREFIX}/part-00002.parquet")["Body"].read()
+    assert pq.read_table(io.BytesIO(body)).column("id").to_pylist() == ["3", "4", "5"]
+
+
+def test_rolling_parts_without_rows_upload_nothing(part_sink, s3_client):
+    part_sink.finish()
+
+    assert part_sink.success is None
+    assert _keys(s3_client) == []
+
+
+def test_rolling_parts_abort_deletes_uploaded_parts(part_sink, s3_client):
+    for page in range(3):
+        part_sink.write_rows(_rows(page * 3))
+    for _, upload in part_sink._uploads:
+        assert upload.result() is True
+
+    part_sink.abort()
+
+    assert part_sink.success is False
+    assert _keys(s3_client) == []
+
+
+def test_rolling_parts_failed_upload_deletes_parts_without_marker(part_sink, s3_client, monkeypatch):
+    upload_file = s3_client.upload_file
+
+    def flaky_upload_file(local_path, bucket, key, extra_args=None):
+        if key.endswith("part-00002.parquet"):
+            return False
+        return upload_file(local_path=local_path, bucket=bucket, key=key, extra_args=extra_args)
+
+    monkeypatch.setattr(s3_client, "upload_file", flaky_upload_file)
+
+    for page in range(3):
+        part_sink.write_rows(_rows(page * 3))
+    part_sink.finish()
+
+    assert part_sink.success is False
+    assert _keys(s3_client) == []
@@ -0,0 +1,64 @@
+import pytest
+
+from src.utils.s3_client import MB
+from tests.conftest import BUCKET
+
+
+def _get_object(client, key):
+    return client.s3.get_object(Bucket=BUCKET, Key=key)["Body"].read()
+
+
+def test_upload_stream_round_trip(s3_client):
+    stream = s3_client.open_upload_stream(BUCKET, "raw/small.csv")
+    stream.write(b"id,name\r\n")
+    stream.write(b"1,Customer_1\r\n")
+
+    assert stream.close() is True
+    assert _get_object(s3_client, "raw/small.csv") == b"id,name\r\n1,Customer_1\r\n"
+
+
+def test_upload_stream_multipart_round_trip(s3_client):
+    # Larger than the 16 MiB multipart threshold and the 8 MiB hand-off buffer
+    chunk = bytes(range(256)) * 4096  # 1 MiB
+    stream = s3_client.open_upload_stream(BUCKET, "raw/large.bin")
+    for _ in range(20):
+        stream.write(chunk)
+
+    assert stream.tell() == 20 * MB
+    assert stream.close() is True
+    assert _get_object(s3_client, "raw/large.bin") == chunk * 20
+
+
+def test_upload_stream_extra_args(s3_client):
+    stream = s3_client.open_upload_stream(BUCKET, "raw/data.csv.gz", extra_args={"ContentEncoding": "gzip"})
+    stream.write(b"payload")
+
+    assert stream.close() is True
+    head = s3_client.s3.head_object(Bucket=BUCKET, Key="raw/data.csv.gz")
+    assert head["ContentEncoding"] == "gzip"
+
+
+@pytest.mark.parametrize("size", [1024, 20 * MB])
+def test_upload_stream_abort_leaves_no_object(s3_client, size):
+    stream = s3_client.open_upload_stream(BUCKET, "raw/aborted.csv")
+    stream.write(b"x" * size)
+    stream.abort()
+
+    assert not s3_client.exists(BUCKET, "raw/aborted.csv")
+    uploads = s3_client.s3.list_multipart_uploads(Bucket=BUCKET)
+    assert not uploads.get("Uploads")
+
+
+def test_upload_stream_rejects_writes_after_close(s3_client):
+    stream = s3_client.open_upload_stream(BUCKET, "raw/closed.csv")
+    assert stream.close() is True
+
+    with pytest.raises(ValueError):
+        stream.write(b"late")
+
+
+def test_delete_removes_object(s3_client):
+    s3_client.s3.put_object(Bucket=BUCKET, Key="raw/part-00000.csv", Body=b"id\r\n")
+
+    assert s3_client.delete(BUCKET, "raw/part-00000.csv") is True
+    assert not s3_client.exists(BUCKET, "raw/part-00000.csv")
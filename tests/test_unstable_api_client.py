@@ -0,0 +1,86 @@
+import asyncio
+import contextlib
+import logging
+
+import requests
+from aiohttp import web
+
+from src.utils.unstable_api_client import UnstableAPIClient
+
+PAGE = b'{"metadata": {"total_pages": 1}, "data": [{"id": 1}]}'
+
+
+class _FakeAuth:
+    """Auth client whose first `failures` header requests raise like a failed /login."""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+
+    def get_auth_header(self):
+        if self.failures:
+            self.failures -= 1
+            raise requests.HTTPError("500 Server Error: login")
+        return {"Authorization": "Bearer token"}
+
+    def invalidate(self, rejected_header=None):
+        pass
+
+
+@contextlib.asynccontextmanager
+async def _serve(handler):
+    app = web.Application()
+    app.router.add_get("/data", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    try:
+        port = site._server.sockets[0].getsockname()[1]
+        yield f"http://127.0.0.1:{port}/data"
+    finally:
+        await runner.cleanup()
+
+
+def _fetch_all(handler, auth):
+    async def run():
+        async with _serve(handler) as url:
+            client = UnstableAPIClient(url, auth, logging.getLogger("test"), max_retries=3)
+            client._backoff = lambda attempts: 0
+            pages = [page async for page in client.iterate_all_pages_async(limit=10, concurrency=2)]
+            return client, pages
+
+    return asyncio.run(run())
+
+
+def test_async_retries_failed_auth_refresh():
+    async def handler(request):
+        return web.Response(body=PAGE, content_type="application/json")
+
+    client, pages = _fetch_all(handler, _FakeAuth(failures=1))
+
+    assert pages == [(1, {"metadata": {"total_pages": 1}, "data": [{"id": 1}]})]
+    assert client.retry_count == 1
+
+
+def test_async_retries_malformed_json():
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        body = PAGE[:10] if len(calls) == 1 else PAGE
+        return web.Response(body=body, content_type="application/json")
+
+    client, pages = _fetch_all(handler, _FakeAuth())
+
+    assert pages[0][1]["data"] == [{"id": 1}]
+    assert client.retry_count == 1
+
+
+def test_async_accepts_json_with_other_content_type():
+    async def handler(request):
+        return web.Response(body=PAGE, content_type="text/plain")
+
+    client, pages = _fetch_all(handler, _FakeAuth())
+
+    assert pages[0][1]["data"] == [{"id": 1}]
+    assert client.retry_count == 0